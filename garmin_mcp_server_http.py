@@ -2,12 +2,21 @@
 HTTP-based MCP Server for Garmin Connect Data (for Kubernetes deployment)
 """
 
+import asyncio
+import concurrent.futures
+import importlib
 import os
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Final
 from dotenv import load_dotenv
 import requests
+from cachetools import TTLCache
 
 from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
+from starlette.responses import JSONResponse
 
 # Try to load .env file if it exists (for local development)
 env_path = Path(__file__).parent / ".env"
@@ -20,20 +29,26 @@ else:
 from garth.exc import GarthHTTPError
 from garminconnect import Garmin, GarminConnectAuthenticationError
 
-# Import all modules
-from modules import (
-    activity_management,
-    health_wellness,
-    user_profile,
-    devices,
-    gear_management,
-    weight_management,
-    challenges,
-    training,
-    workouts,
-    data_management,
-    womens_health,
+import modules
+from modules import NO_CLIENT, call_garmin
+
+# Import all modules in parallel so their file reads overlap instead of
+# adding up before the server (and /health) can come up
+MODULE_NAMES = (
+    "activity_management",
+    "health_wellness",
+    "user_profile",
+    "devices",
+    "gear_management",
+    "weight_management",
+    "challenges",
+    "training",
+    "workouts",
+    "data_management",
+    "womens_health",
 )
+with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+    MODULES = tuple(executor.map(lambda name: importlib.import_module(f"modules.{name}"), MODULE_NAMES))
 
 # Get credentials from environment with defaults
 email = os.environ.get("GARMIN_EMAIL", "")
@@ -50,12 +65,37 @@ else:
     print(f"✓ Using Garmin credentials for: {email}")
 
 
+def save_tokens(garmin):
+    """Persist the client's OAuth tokens to the token directory and the base64 token file."""
+    garmin.garth.dump(tokenstore)
+    print(f"✓ OAuth tokens stored in '{tokenstore}' directory for future use.")
+    
+    # Also save base64 encoded tokens
+    token_base64 = garmin.garth.dumps()
+    dir_path = os.path.expanduser(tokenstore_base64)
+    with open(dir_path, "w") as token_file:
+        token_file.write(token_base64)
+    print(f"✓ OAuth tokens encoded as base64 string and saved to '{dir_path}' file.")
+
+
+def _is_rejected_login(err):
+    """Whether a login error means Garmin Connect rejected the credentials"""
+    if isinstance(err, GarminConnectAuthenticationError):
+        return True
+    response = getattr(getattr(err, "error", None), "response", None)
+    return isinstance(err, GarthHTTPError) and getattr(response, "status_code", None) == 401
+
+
 def init_api(email, password):
-    """Initialize Garmin API with your credentials."""
+    """Initialize Garmin API with your credentials.
+
+    Returns a (client, retry) tuple, where retry tells whether a failed login
+    is worth trying again (e.g. a network error rather than a wrong password).
+    """
     if not email or not password:
         print("⚠️  Cannot initialize Garmin API: missing credentials")
         print("⚠️  Server will start but Garmin API calls will fail")
-        return None
+        return None, False
     
     try:
         print(f"Trying to login to Garmin Connect using token data from directory '{tokenstore}'...")
@@ -79,15 +119,7 @@ def init_api(email, password):
                     os.environ["GARMINTOKENS"] = saved_token_env
             
             # Save the tokens after successful authentication
-            garmin.garth.dump(tokenstore)
-            print(f"✓ OAuth tokens stored in '{tokenstore}' directory for future use.")
-            
-            # Also save base64 encoded tokens
-            token_base64 = garmin.garth.dumps()
-            dir_path = os.path.expanduser(tokenstore_base64)
-            with open(dir_path, "w") as token_file:
-                token_file.write(token_base64)
-            print(f"✓ OAuth tokens encoded as base64 string and saved to '{dir_path}' file.")
+            save_tokens(garmin)
         except (
             FileNotFoundError,
             GarthHTTPError,
@@ -96,39 +128,109 @@ def init_api(email, password):
         ) as err:
             print(f"❌ Error during authentication: {err}")
             print("⚠️  Server will start but Garmin API calls will fail")
-            return None
-    return garmin
+            return None, not _is_rejected_login(err)
+    return garmin, False
 
 
-# Initialize Garmin client at module level
-print("=" * 60)
-print("Initializing Garmin Connect client...")
-print("=" * 60)
-garmin_client = init_api(email, password)
+# The Garmin client is created lazily (warmed in the background at startup
+# and awaited before the first tool call) so the HTTP server and /health come
+# up immediately even when Garmin Connect is slow or unreachable
+garmin_client = None
+_garmin_lock = asyncio.Lock()
+_garmin_init_attempted = False
 
-if not garmin_client:
-    print("=" * 60)
-    print("⚠️  WARNING: Garmin Connect client not initialized")
-    print("⚠️  Server will start in limited mode")
-    print("⚠️  API calls will return error messages")
-    print("=" * 60)
-else:
-    print("=" * 60)
-    print("✓ Garmin Connect client initialized successfully")
-    print("=" * 60)
+# Failed logins that may be transient are retried after a cooldown that doubles
+# on each consecutive failure, so an outage doesn't turn into a login per tool call
+_LOGIN_RETRY_DELAY = 60
+_LOGIN_RETRY_MAX_DELAY = 900
+_garmin_login_failures = 0
+_garmin_retry_at = 0.0
+
+
+def _garmin_ready():
+    """Whether get_garmin has nothing to do right now"""
+    return (
+        garmin_client is not None
+        or _garmin_init_attempted
+        or time.monotonic() < _garmin_retry_at
+    )
+
+
+async def get_garmin():
+    """Return the Garmin client, logging in to Garmin Connect on first use."""
+    global garmin_client, _garmin_init_attempted, _garmin_login_failures, _garmin_retry_at
+    if _garmin_ready():
+        return garmin_client
+    
+    async with _garmin_lock:
+        if _garmin_ready():
+            return garmin_client
+        
+        print("=" * 60)
+        print("Initializing Garmin Connect client...")
+        print("=" * 60)
+        try:
+            client, retry = await asyncio.to_thread(init_api, email, password)
+        except Exception as e:
+            print(f"❌ Error during authentication: {e}")
+            client, retry = None, True
+        
+        if retry:
+            _garmin_login_failures += 1
+            delay = min(_LOGIN_RETRY_DELAY * 2 ** (_garmin_login_failures - 1), _LOGIN_RETRY_MAX_DELAY)
+            _garmin_retry_at = time.monotonic() + delay
+            print(f"⚠️  Will retry Garmin Connect login in {delay}s")
+        else:
+            # Logged in, no credentials, or credentials rejected: don't try again
+            _garmin_init_attempted = True
+        
+        if not client:
+            print("=" * 60)
+            print("⚠️  WARNING: Garmin Connect client not initialized")
+            print("⚠️  Server will run in limited mode")
+            print("⚠️  API calls will return error messages")
+            print("=" * 60)
+        else:
+            # Enlarge garth's keep-alive pool so concurrent tool calls reuse TCP/TLS
+            # connections to Garmin instead of opening a new one each time
+            client.garth.configure(pool_connections=16, pool_maxsize=32)
+            print("=" * 60)
+            print("✓ Garmin Connect client initialized successfully")
+            print("=" * 60)
+        
+        # Configure all modules with the Garmin client (even if None)
+        modules.configure(client, save_tokens)
+        for module in MODULES:
+            module.configure(client)
+        garmin_client = client
+    
+    return garmin_client
+
+
+def _log_warmup_error(task):
+    """Log a failed background login, which would otherwise go unreported"""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"❌ Background Garmin Connect login failed: {task.exception()}")
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """Start logging in to Garmin Connect in the background without blocking startup"""
+    warmup = asyncio.create_task(get_garmin())
+    warmup.add_done_callback(_log_warmup_error)
+    try:
+        yield {}
+    finally:
+        warmup.cancel()
+
+
+class GarminLoginMiddleware(Middleware):
+    """Make sure the Garmin login has completed before any tool runs"""
+    
+    async def on_call_tool(self, context, call_next):
+        await get_garmin()
+        return await call_next(context)
 
-# Configure all modules with the Garmin client (even if None)
-activity_management.configure(garmin_client)
-health_wellness.configure(garmin_client)
-user_profile.configure(garmin_client)
-devices.configure(garmin_client)
-gear_management.configure(garmin_client)
-weight_management.configure(garmin_client)
-challenges.configure(garmin_client)
-training.configure(garmin_client)
-workouts.configure(garmin_client)
-data_management.configure(garmin_client)
-womens_health.configure(garmin_client)
 
 # Create OAuth provider using GitHub authentication
 # This ensures only authorized GitHub users can access the server
@@ -136,6 +238,11 @@ auth_provider = None
 github_client_id = os.environ.get("GITHUB_CLIENT_ID", "")
 github_client_secret = os.environ.get("GITHUB_CLIENT_SECRET", "")
 allowed_github_username = os.environ.get("ALLOWED_GITHUB_USERNAME", "angryninja48")
+# Comma-separated, so a team can share one deployment
+allowed_github_usernames = frozenset(
+    name.strip() for name in allowed_github_username.split(",") if name.strip()
+)
+mcp_base_url = os.environ.get("MCP_BASE_URL", "http://localhost:8000")
 
 if github_client_id and github_client_secret:
     from fastmcp.server.auth.providers.github import GitHubProvider
@@ -145,21 +252,21 @@ if github_client_id and github_client_secret:
     auth_provider = GitHubProvider(
         client_id=github_client_id,
         client_secret=github_client_secret,
-        base_url=os.environ.get("MCP_BASE_URL", "http://localhost:8000"),
+        base_url=mcp_base_url,
     )
     
     print(f"✓ GitHub OAuth provider configured")
-    print(f"  Base URL: {os.environ.get('MCP_BASE_URL', 'http://localhost:8000')}")
-    print(f"  Callback URL: {os.environ.get('MCP_BASE_URL', 'http://localhost:8000')}/auth/callback")
-    print(f"  Allowed user: {allowed_github_username}")
+    print(f"  Base URL: {mcp_base_url}")
+    print(f"  Callback URL: {mcp_base_url}/auth/callback")
+    print(f"  Allowed users: {', '.join(sorted(allowed_github_usernames))}")
     print()
     print("=" * 60)
     print("Claude Custom Connector Configuration:")
     print("=" * 60)
-    print(f"Server URL: {os.environ.get('MCP_BASE_URL', 'http://localhost:8000')}/mcp")
+    print(f"Server URL: {mcp_base_url}/mcp")
     print(f"")
     print(f"Authentication: GitHub OAuth")
-    print(f"Only GitHub user '{allowed_github_username}' can access this server.")
+    print(f"Only GitHub users {', '.join(sorted(allowed_github_usernames))} can access this server.")
     print("=" * 60)
 else:
     print("⚠️  WARNING: GitHub OAuth not configured!")
@@ -168,12 +275,19 @@ else:
     print("⚠️  Create OAuth App at: https://github.com/settings/developers")
 
 # Create the MCP server with OAuth authentication
-mcp = FastMCP("Garmin Connect v1.0", auth=auth_provider)
+mcp = FastMCP("Garmin Connect v1.0", auth=auth_provider, lifespan=lifespan)
+mcp.add_middleware(GarminLoginMiddleware())
 
 # Configure host and port via settings (as per GitHub issue #873 workaround)
 mcp.settings.host = "0.0.0.0"
 mcp.settings.port = 8000
 
+# Authorization decisions keyed on the raw access token, so repeated tool
+# calls with the same token skip re-inspecting its claims
+_auth_decisions = TTLCache(maxsize=1024, ttl=300)
+_NOT_CACHED = object()
+
+
 # Helper function to check if user is authorized
 def check_github_auth():
     """Check if the authenticated GitHub user is allowed to access the server."""
@@ -184,68 +298,160 @@ def check_github_auth():
     try:
         from fastmcp.server.dependencies import get_access_token
         token = get_access_token()
+        decision = _auth_decisions.get(token.token, _NOT_CACHED)
+        if decision is not _NOT_CACHED:
+            return decision
+        
         github_username = token.claims.get("login", "")
         
-        if github_username != allowed_github_username:
-            return f"❌ Access denied: GitHub user '{github_username}' is not authorized. Only '{allowed_github_username}' can access this server."
+        if github_username not in allowed_github_usernames:
+            decision = f"❌ Access denied: GitHub user '{github_username}' is not authorized. Only {', '.join(sorted(allowed_github_usernames))} can access this server."
+        else:
+            decision = None  # Authorized
         
-        return None  # Authorized
+        _auth_decisions[token.token] = decision
+        return decision
     except Exception as e:
         return f"❌ Authentication error: {str(e)}"
 
 # Register tools from all modules
-mcp = activity_management.register_tools(mcp)
-mcp = health_wellness.register_tools(mcp)
-mcp = user_profile.register_tools(mcp)
-mcp = devices.register_tools(mcp)
-mcp = gear_management.register_tools(mcp)
-mcp = weight_management.register_tools(mcp)
-mcp = challenges.register_tools(mcp)
-mcp = training.register_tools(mcp)
-mcp = workouts.register_tools(mcp)
-mcp = data_management.register_tools(mcp)
-mcp = womens_health.register_tools(mcp)
+for module in MODULES:
+    mcp = module.register_tools(mcp)
+
+
+# Responses for the activity listing tool
+_NO_ACTIVITIES: Final = "No activities found."
+_ERR_LIST_ACTIVITIES: Final = "Error retrieving activities: {}".format
 
 
 # Add activity listing tool directly to the server
 @mcp.tool()
-async def list_activities(limit: int = 5) -> str:
-    """List recent Garmin activities"""
+async def list_activities(limit: int = 5, fields: list[str] | None = None) -> list[dict] | str:
+    """List recent Garmin activities
+    
+    Args:
+        limit: Number of most recent activities to return
+        fields: Optional raw Garmin activity fields to return instead of the default
+            summary (e.g., ["activityId", "startTimeLocal", "distance"])
+    """
     # Check GitHub authorization
     auth_error = check_github_auth()
     if auth_error:
         return auth_error
     
     if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+        return NO_CLIENT
     
     try:
-        activities = garmin_client.get_activities(0, limit)
+        activities = await call_garmin(garmin_client.get_activities, 0, limit)
         if not activities:
-            return "No activities found."
-
-        result = f"Last {len(activities)} activities:\n\n"
-        for idx, activity in enumerate(activities, 1):
-            result += f"--- Activity {idx} ---\n"
-            result += f"Activity: {activity.get('activityName', 'Unknown')}\n"
-            result += f"Type: {activity.get('activityType', {}).get('typeKey', 'Unknown')}\n"
-            result += f"Date: {activity.get('startTimeLocal', 'Unknown')}\n"
-            result += f"ID: {activity.get('activityId', 'Unknown')}\n\n"
-        return result
+            return _NO_ACTIVITIES
+
+        if fields:
+            return [{field: activity.get(field) for field in fields} for activity in activities]
+
+        return [
+            {
+                "name": activity.get("activityName", "Unknown"),
+                "type": activity.get("activityType", {}).get("typeKey", "Unknown"),
+                "date": activity.get("startTimeLocal", "Unknown"),
+                "id": activity.get("activityId", "Unknown"),
+            }
+            for activity in activities
+        ]
     except Exception as e:
-        return f"Error retrieving activities: {str(e)}"
+        return _ERR_LIST_ACTIVITIES(e)
+
+
+# Registry of every tool registered above, used by batch_execute to dispatch
+# calls in-process instead of paying one MCP round-trip per tool
+TOOLS = dict(mcp._tool_manager._tools)
+
+
+# Prefixes of the messages tools return when a call fails
+_TOOL_ERROR_PREFIXES = ("Error", "❌")
+
+
+def _tool_result_value(tool, result):
+    """Turn a ToolResult back into the value the tool function returned"""
+    structured = result.structured_content
+    if structured is not None:
+        if tool.output_schema and tool.output_schema.get("x-fastmcp-wrap-result"):
+            return structured["result"]
+        return structured
+    return "".join(getattr(block, "text", "") for block in result.content)
+
+
+@mcp.tool()
+async def batch_execute(calls: list[dict], max_concurrent: int = 8, stop_on_error: bool = False) -> list:
+    """Run several Garmin tools in a single request and return all results at once
+
+    Args:
+        calls: List of tool calls, each of the form {"tool": "<tool name>", "args": {...}}
+        max_concurrent: Maximum number of tool calls running at the same time
+        stop_on_error: Abort the whole batch on the first failing call instead of returning its error in place.
+            A call fails when the tool is unknown, its arguments are invalid, or it returns an
+            "Error ..."/"❌ ..." message. Calls that have not finished yet are cancelled.
+    """
+    # Check GitHub authorization
+    auth_error = check_github_auth()
+    if auth_error:
+        return [auth_error]
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def _run(call):
+        name = call.get("tool")
+        tool = TOOLS.get(name)
+        if tool is None:
+            raise ValueError(f"Unknown tool '{name}'")
+        async with semaphore:
+            # Go through Tool.run so arguments are validated and coerced
+            # exactly as they are for a direct tool call
+            result = await tool.run(call.get("args") or {})
+        value = _tool_result_value(tool, result)
+        # Tools report their own failures as messages instead of raising
+        if stop_on_error and isinstance(value, str) and value.startswith(_TOOL_ERROR_PREFIXES):
+            raise RuntimeError(value)
+        return value
+
+    if not stop_on_error:
+        results = await asyncio.gather(*[_run(c) for c in calls], return_exceptions=True)
+    else:
+        # A TaskGroup cancels the calls still pending as soon as one fails, so no
+        # further writes run after the batch has been reported as aborted
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_run(c)) for c in calls]
+        except ExceptionGroup as eg:
+            return [f"Error executing batch: {str(eg.exceptions[0])}"]
+        results = [task.result() for task in tasks]
+
+    return [
+        f"Error running {call.get('tool')}: {str(result)}" if isinstance(result, Exception) else result
+        for call, result in zip(calls, results)
+    ]
+
+
+# Health responses are built once and reused, since liveness probes hit
+# /health far more often than the Garmin connection state changes
+_HEALTH_CONNECTED = JSONResponse({
+    "status": "healthy",
+    "server": "Garmin Connect MCP",
+    "garmin_connected": True
+})
+_HEALTH_DISCONNECTED = JSONResponse({
+    "status": "healthy",
+    "server": "Garmin Connect MCP",
+    "garmin_connected": False
+})
 
 
 # Add a custom health check endpoint for Docker/Kubernetes
 @mcp.custom_route(path="/health", methods=["GET"])
 async def health_check(request):
     """Simple health check endpoint for container orchestration"""
-    from starlette.responses import JSONResponse
-    return JSONResponse({
-        "status": "healthy",
-        "server": "Garmin Connect MCP",
-        "garmin_connected": garmin_client is not None
-    })
+    return _HEALTH_CONNECTED if garmin_client is not None else _HEALTH_DISCONNECTED
 
 
 # Run the server using FastMCP's built-in HTTP support
@@ -1 +1,55 @@
 # Garmin Connect MCP modules
+import asyncio
+import threading
+
+from garth.exc import GarthHTTPError
+from garminconnect import GarminConnectAuthenticationError
+
+# Returned by every tool when the Garmin client is not available
+NO_CLIENT = "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+
+# The garmin_client and the token-persisting callback will be set by the main file
+garmin_client = None
+_save_tokens = None
+
+# Serializes token refreshes when several tool calls hit a 401 at once
+_token_lock = threading.Lock()
+
+
+def configure(client, save_tokens=None):
+    """Configure the package with the Garmin client and a callback that persists its tokens"""
+    global garmin_client, _save_tokens
+    garmin_client = client
+    _save_tokens = save_tokens
+
+
+def refresh_on_401(func, *args, **kwargs):
+    """Call a Garmin API function, refreshing the OAuth2 token and retrying once on a 401."""
+    client = garmin_client
+    token = client.garth.oauth2_token if client is not None else None
+    try:
+        return func(*args, **kwargs)
+    except (GarthHTTPError, GarminConnectAuthenticationError) as err:
+        if client is None:
+            raise
+        response = getattr(getattr(err, "error", None), "response", None)
+        if isinstance(err, GarthHTTPError) and getattr(response, "status_code", None) != 401:
+            raise
+        with _token_lock:
+            # Another call may already have refreshed the token while this one was in flight
+            if client.garth.oauth2_token is token:
+                print("Garmin Connect returned 401, refreshing OAuth2 token...")
+                client.garth.refresh_oauth2()
+                if _save_tokens:
+                    # The refreshed token is already in memory, so a token store that
+                    # can't be written (e.g. a read-only secret mount) mustn't fail the call
+                    try:
+                        _save_tokens(client)
+                    except OSError as e:
+                        print(f"⚠️  Could not save refreshed OAuth tokens: {e}")
+        return func(*args, **kwargs)
+
+
+async def call_garmin(func, *args, **kwargs):
+    """Run a blocking Garmin API call in a worker thread, refreshing the token on a 401"""
+    return await asyncio.to_thread(refresh_on_401, func, *args, **kwargs)
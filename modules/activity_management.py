@@ -4,6 +4,8 @@ Activity Management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -16,8 +18,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -38,7 +40,7 @@ def register_tools(app):
             return error
         
         try:
-            activities = garmin_client.get_activities_by_date(start_date, end_date, activity_type)
+            activities = await call_garmin(garmin_client.get_activities_by_date, start_date, end_date, activity_type)
             if not activities:
                 return f"No activities found between {start_date} and {end_date}" + \
                        (f" for activity type '{activity_type}'" if activity_type else "")
@@ -59,7 +61,7 @@ def register_tools(app):
             return error
         
         try:
-            activities = garmin_client.get_activities_fordate(date)
+            activities = await call_garmin(garmin_client.get_activities_fordate, date)
             if not activities:
                 return f"No activities found for {date}"
             
@@ -74,8 +76,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            activity = garmin_client.get_activity(activity_id)
+            activity = await call_garmin(garmin_client.get_activity, activity_id)
             if not activity:
                 return f"No activity found with ID {activity_id}"
             
@@ -90,8 +96,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve splits for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            splits = garmin_client.get_activity_splits(activity_id)
+            splits = await call_garmin(garmin_client.get_activity_splits, activity_id)
             if not splits:
                 return f"No splits found for activity with ID {activity_id}"
             
@@ -106,8 +116,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve typed splits for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            typed_splits = garmin_client.get_activity_typed_splits(activity_id)
+            typed_splits = await call_garmin(garmin_client.get_activity_typed_splits, activity_id)
             if not typed_splits:
                 return f"No typed splits found for activity with ID {activity_id}"
             
@@ -122,8 +136,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve split summaries for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            split_summaries = garmin_client.get_activity_split_summaries(activity_id)
+            split_summaries = await call_garmin(garmin_client.get_activity_split_summaries, activity_id)
             if not split_summaries:
                 return f"No split summaries found for activity with ID {activity_id}"
             
@@ -138,8 +156,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve weather data for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            weather = garmin_client.get_activity_weather(activity_id)
+            weather = await call_garmin(garmin_client.get_activity_weather, activity_id)
             if not weather:
                 return f"No weather data found for activity with ID {activity_id}"
             
@@ -154,8 +176,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve heart rate time zone data for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            hr_zones = garmin_client.get_activity_hr_in_timezones(activity_id)
+            hr_zones = await call_garmin(garmin_client.get_activity_hr_in_timezones, activity_id)
             if not hr_zones:
                 return f"No heart rate time zone data found for activity with ID {activity_id}"
             
@@ -170,8 +196,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve gear data for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            gear = garmin_client.get_activity_gear(activity_id)
+            gear = await call_garmin(garmin_client.get_activity_gear, activity_id)
             if not gear:
                 return f"No gear data found for activity with ID {activity_id}"
             
@@ -186,8 +216,12 @@ def register_tools(app):
         Args:
             activity_id: ID of the activity to retrieve exercise sets for
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            exercise_sets = garmin_client.get_activity_exercise_sets(activity_id)
+            exercise_sets = await call_garmin(garmin_client.get_activity_exercise_sets, activity_id)
             if not exercise_sets:
                 return f"No exercise sets found for activity with ID {activity_id}"
             
@@ -4,6 +4,8 @@ Challenges and badges functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -31,8 +33,12 @@ def register_tools(app):
         Args:
             goal_type: Type of goals to retrieve. Options: "active", "future", or "past"
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            goals = garmin_client.get_goals(goal_type)
+            goals = await call_garmin(garmin_client.get_goals, goal_type)
             if not goals:
                 return f"No {goal_type} goals found."
             return goals
@@ -47,7 +53,7 @@ def register_tools(app):
             return error
         
         try:
-            records = garmin_client.get_personal_record()
+            records = await call_garmin(garmin_client.get_personal_record)
             if not records:
                 return "No personal records found."
             return records
@@ -62,7 +68,7 @@ def register_tools(app):
             return error
         
         try:
-            badges = garmin_client.get_earned_badges()
+            badges = await call_garmin(garmin_client.get_earned_badges)
             if not badges:
                 return "No earned badges found."
             return badges
@@ -82,7 +88,7 @@ def register_tools(app):
             return error
         
         try:
-            challenges = garmin_client.get_adhoc_challenges(start, limit)
+            challenges = await call_garmin(garmin_client.get_adhoc_challenges, start, limit)
             if not challenges:
                 return "No adhoc challenges found."
             return challenges
@@ -102,7 +108,7 @@ def register_tools(app):
             return error
         
         try:
-            challenges = garmin_client.get_available_badge_challenges(start, limit)
+            challenges = await call_garmin(garmin_client.get_available_badge_challenges, start, limit)
             if not challenges:
                 return "No available badge challenges found."
             return challenges
@@ -122,7 +128,7 @@ def register_tools(app):
             return error
         
         try:
-            challenges = garmin_client.get_badge_challenges(start, limit)
+            challenges = await call_garmin(garmin_client.get_badge_challenges, start, limit)
             if not challenges:
                 return "No badge challenges found."
             return challenges
@@ -142,7 +148,7 @@ def register_tools(app):
             return error
         
         try:
-            challenges = garmin_client.get_non_completed_badge_challenges(start, limit)
+            challenges = await call_garmin(garmin_client.get_non_completed_badge_challenges, start, limit)
             if not challenges:
                 return "No non-completed badge challenges found."
             return challenges
@@ -157,7 +163,7 @@ def register_tools(app):
             return error
         
         try:
-            predictions = garmin_client.get_race_predictions()
+            predictions = await call_garmin(garmin_client.get_race_predictions)
             if not predictions:
                 return "No race predictions found."
             return predictions
@@ -177,7 +183,8 @@ def register_tools(app):
             return error
         
         try:
-            challenges = garmin_client.get_inprogress_virtual_challenges(
+            challenges = await call_garmin(
+                garmin_client.get_inprogress_virtual_challenges,
                 start_date, end_date
             )
             if not challenges:
@@ -4,6 +4,8 @@ Data management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -57,8 +59,13 @@ def register_tools(app):
             visceral_fat_rating: Visceral fat rating
             bmi: Body Mass Index
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            result = garmin_client.add_body_composition(
+            result = await call_garmin(
+                garmin_client.add_body_composition,
                 date,
                 weight=weight,
                 percent_fat=percent_fat,
@@ -92,8 +99,13 @@ def register_tools(app):
             pulse: Pulse rate
             notes: Optional notes
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            result = garmin_client.set_blood_pressure(
+            result = await call_garmin(
+                garmin_client.set_blood_pressure,
                 systolic, diastolic, pulse, notes=notes
             )
             return result
@@ -113,8 +125,13 @@ def register_tools(app):
             cdate: Date in YYYY-MM-DD format
             timestamp: Timestamp in YYYY-MM-DDThh:mm:ss.sss format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            result = garmin_client.add_hydration_data(
+            result = await call_garmin(
+                garmin_client.add_hydration_data,
                 value_in_ml=value_in_ml,
                 cdate=cdate,
                 timestamp=timestamp
@@ -4,6 +4,8 @@ Device-related functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -32,7 +34,7 @@ def register_tools(app):
             return error
         
         try:
-            devices = garmin_client.get_devices()
+            devices = await call_garmin(garmin_client.get_devices)
             if not devices:
                 return "No devices found."
             return devices
@@ -47,7 +49,7 @@ def register_tools(app):
             return error
         
         try:
-            device = garmin_client.get_device_last_used()
+            device = await call_garmin(garmin_client.get_device_last_used)
             if not device:
                 return "No last used device found."
             return device
@@ -66,7 +68,7 @@ def register_tools(app):
             return error
         
         try:
-            settings = garmin_client.get_device_settings(device_id)
+            settings = await call_garmin(garmin_client.get_device_settings, device_id)
             if not settings:
                 return f"No settings found for device ID {device_id}."
             return settings
@@ -81,7 +83,7 @@ def register_tools(app):
             return error
         
         try:
-            device = garmin_client.get_primary_training_device()
+            device = await call_garmin(garmin_client.get_primary_training_device)
             if not device:
                 return "No primary training device found."
             return device
@@ -101,7 +103,7 @@ def register_tools(app):
             return error
         
         try:
-            solar_data = garmin_client.get_device_solar_data(device_id, date)
+            solar_data = await call_garmin(garmin_client.get_device_solar_data, device_id, date)
             if not solar_data:
                 return f"No solar data found for device ID {device_id} on {date}."
             return solar_data
@@ -116,7 +118,7 @@ def register_tools(app):
             return error
         
         try:
-            alarms = garmin_client.get_device_alarms()
+            alarms = await call_garmin(garmin_client.get_device_alarms)
             if not alarms:
                 return "No device alarms found."
             return alarms
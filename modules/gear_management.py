@@ -4,6 +4,8 @@ Gear management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -36,7 +38,7 @@ def register_tools(app):
             return error
         
         try:
-            gear = garmin_client.get_gear(user_profile_id)
+            gear = await call_garmin(garmin_client.get_gear, user_profile_id)
             if not gear:
                 return "No gear found."
             return gear
@@ -55,7 +57,7 @@ def register_tools(app):
             return error
         
         try:
-            defaults = garmin_client.get_gear_defaults(user_profile_id)
+            defaults = await call_garmin(garmin_client.get_gear_defaults, user_profile_id)
             if not defaults:
                 return "No gear defaults found."
             return defaults
@@ -74,7 +76,7 @@ def register_tools(app):
             return error
         
         try:
-            stats = garmin_client.get_gear_stats(gear_uuid)
+            stats = await call_garmin(garmin_client.get_gear_stats, gear_uuid)
             if not stats:
                 return f"No stats found for gear with UUID {gear_uuid}."
             return stats
@@ -4,6 +4,8 @@ Health & Wellness Data functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -16,8 +18,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -36,7 +38,7 @@ def register_tools(app):
             return error
         
         try:
-            stats = garmin_client.get_stats(date)
+            stats = await call_garmin(garmin_client.get_stats, date)
             if not stats:
                 return f"No stats found for {date}"
             
@@ -51,8 +53,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            summary = garmin_client.get_user_summary(date)
+            summary = await call_garmin(garmin_client.get_user_summary, date)
             if not summary:
                 return f"No user summary found for {date}"
             
@@ -68,13 +74,17 @@ def register_tools(app):
             start_date: Date in YYYY-MM-DD format or start date if end_date provided
             end_date: Optional end date in YYYY-MM-DD format for date range
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
             if end_date:
-                composition = garmin_client.get_body_composition(start_date, end_date)
+                composition = await call_garmin(garmin_client.get_body_composition, start_date, end_date)
                 if not composition:
                     return f"No body composition data found between {start_date} and {end_date}"
             else:
-                composition = garmin_client.get_body_composition(start_date)
+                composition = await call_garmin(garmin_client.get_body_composition, start_date)
                 if not composition:
                     return f"No body composition data found for {start_date}"
             
@@ -89,8 +99,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            data = garmin_client.get_stats_and_body(date)
+            data = await call_garmin(garmin_client.get_stats_and_body, date)
             if not data:
                 return f"No stats and body composition data found for {date}"
             
@@ -105,8 +119,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            steps_data = garmin_client.get_steps_data(date)
+            steps_data = await call_garmin(garmin_client.get_steps_data, date)
             if not steps_data:
                 return f"No steps data found for {date}"
             
@@ -122,8 +140,12 @@ def register_tools(app):
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            steps_data = garmin_client.get_daily_steps(start_date, end_date)
+            steps_data = await call_garmin(garmin_client.get_daily_steps, start_date, end_date)
             if not steps_data:
                 return f"No daily steps data found between {start_date} and {end_date}"
             
@@ -138,8 +160,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            readiness = garmin_client.get_training_readiness(date)
+            readiness = await call_garmin(garmin_client.get_training_readiness, date)
             if not readiness:
                 return f"No training readiness data found for {date}"
             
@@ -155,8 +181,12 @@ def register_tools(app):
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            battery_data = garmin_client.get_body_battery(start_date, end_date)
+            battery_data = await call_garmin(garmin_client.get_body_battery, start_date, end_date)
             if not battery_data:
                 return f"No body battery data found between {start_date} and {end_date}"
             
@@ -171,8 +201,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            events = garmin_client.get_body_battery_events(date)
+            events = await call_garmin(garmin_client.get_body_battery_events, date)
             if not events:
                 return f"No body battery events found for {date}"
             
@@ -188,8 +222,12 @@ def register_tools(app):
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            bp_data = garmin_client.get_blood_pressure(start_date, end_date)
+            bp_data = await call_garmin(garmin_client.get_blood_pressure, start_date, end_date)
             if not bp_data:
                 return f"No blood pressure data found between {start_date} and {end_date}"
             
@@ -204,8 +242,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            floors_data = garmin_client.get_floors(date)
+            floors_data = await call_garmin(garmin_client.get_floors, date)
             if not floors_data:
                 return f"No floors data found for {date}"
             
@@ -220,8 +262,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            status = garmin_client.get_training_status(date)
+            status = await call_garmin(garmin_client.get_training_status, date)
             if not status:
                 return f"No training status data found for {date}"
             
@@ -236,8 +282,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            rhr_data = garmin_client.get_rhr_day(date)
+            rhr_data = await call_garmin(garmin_client.get_rhr_day, date)
             if not rhr_data:
                 return f"No resting heart rate data found for {date}"
             
@@ -252,8 +302,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            hr_data = garmin_client.get_heart_rates(date)
+            hr_data = await call_garmin(garmin_client.get_heart_rates, date)
             if not hr_data:
                 return f"No heart rate data found for {date}"
             
@@ -268,8 +322,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            hydration_data = garmin_client.get_hydration_data(date)
+            hydration_data = await call_garmin(garmin_client.get_hydration_data, date)
             if not hydration_data:
                 return f"No hydration data found for {date}"
             
@@ -284,8 +342,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            sleep_data = garmin_client.get_sleep_data(date)
+            sleep_data = await call_garmin(garmin_client.get_sleep_data, date)
             if not sleep_data:
                 return f"No sleep data found for {date}"
             
@@ -300,8 +362,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            stress_data = garmin_client.get_stress_data(date)
+            stress_data = await call_garmin(garmin_client.get_stress_data, date)
             if not stress_data:
                 return f"No stress data found for {date}"
             
@@ -316,8 +382,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            respiration_data = garmin_client.get_respiration_data(date)
+            respiration_data = await call_garmin(garmin_client.get_respiration_data, date)
             if not respiration_data:
                 return f"No respiration data found for {date}"
             
@@ -332,8 +402,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            spo2_data = garmin_client.get_spo2_data(date)
+            spo2_data = await call_garmin(garmin_client.get_spo2_data, date)
             if not spo2_data:
                 return f"No SpO2 data found for {date}"
             
@@ -348,8 +422,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            stress_data = garmin_client.get_all_day_stress(date)
+            stress_data = await call_garmin(garmin_client.get_all_day_stress, date)
             if not stress_data:
                 return f"No all-day stress data found for {date}"
             
@@ -364,8 +442,12 @@ def register_tools(app):
         Args:
             date: Date in YYYY-MM-DD format
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            events = garmin_client.get_all_day_events(date)
+            events = await call_garmin(garmin_client.get_all_day_events, date)
             if not events:
                 return f"No daily wellness events found for {date}"
             
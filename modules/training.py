@@ -4,6 +4,8 @@ Training and performance functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -35,8 +37,13 @@ def register_tools(app):
             end_date: End date in YYYY-MM-DD format
             metric: Metric to get progress for (e.g., "elevationGain", "duration", "distance", "movingDuration")
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
-            summary = garmin_client.get_progress_summary_between_dates(
+            summary = await call_garmin(
+                garmin_client.get_progress_summary_between_dates,
                 start_date, end_date, metric
             )
             if not summary:
@@ -58,7 +65,7 @@ def register_tools(app):
             return error
         
         try:
-            hill_score = garmin_client.get_hill_score(start_date, end_date)
+            hill_score = await call_garmin(garmin_client.get_hill_score, start_date, end_date)
             if not hill_score:
                 return f"No hill score data found between {start_date} and {end_date}."
             return hill_score
@@ -78,7 +85,7 @@ def register_tools(app):
             return error
         
         try:
-            endurance_score = garmin_client.get_endurance_score(start_date, end_date)
+            endurance_score = await call_garmin(garmin_client.get_endurance_score, start_date, end_date)
             if not endurance_score:
                 return f"No endurance score data found between {start_date} and {end_date}."
             return endurance_score
@@ -97,7 +104,7 @@ def register_tools(app):
             return error
         
         try:
-            effect = garmin_client.get_training_effect(activity_id)
+            effect = await call_garmin(garmin_client.get_training_effect, activity_id)
             if not effect:
                 return f"No training effect data found for activity with ID {activity_id}."
             return effect
@@ -116,7 +123,7 @@ def register_tools(app):
             return error
         
         try:
-            metrics = garmin_client.get_max_metrics(date)
+            metrics = await call_garmin(garmin_client.get_max_metrics, date)
             if not metrics:
                 return f"No max metrics data found for {date}."
             return metrics
@@ -135,7 +142,7 @@ def register_tools(app):
             return error
         
         try:
-            hrv_data = garmin_client.get_hrv_data(date)
+            hrv_data = await call_garmin(garmin_client.get_hrv_data, date)
             if not hrv_data:
                 return f"No HRV data found for {date}."
             return hrv_data
@@ -154,7 +161,7 @@ def register_tools(app):
             return error
         
         try:
-            fitness_age = garmin_client.get_fitnessage_data(date)
+            fitness_age = await call_garmin(garmin_client.get_fitnessage_data, date)
             if not fitness_age:
                 return f"No fitness age data found for {date}."
             return fitness_age
@@ -173,7 +180,7 @@ def register_tools(app):
             return error
         
         try:
-            result = garmin_client.request_reload(date)
+            result = await call_garmin(garmin_client.request_reload, date)
             return result
         except Exception as e:
             return f"Error requesting data reload: {str(e)}"
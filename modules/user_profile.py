@@ -4,6 +4,8 @@ User Profile functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -32,7 +34,7 @@ def register_tools(app):
             return error
         
         try:
-            full_name = garmin_client.get_full_name()
+            full_name = await call_garmin(garmin_client.get_full_name)
             return full_name
         except Exception as e:
             return f"Error retrieving user's full name: {str(e)}"
@@ -45,7 +47,7 @@ def register_tools(app):
             return error
         
         try:
-            unit_system = garmin_client.get_unit_system()
+            unit_system = await call_garmin(garmin_client.get_unit_system)
             return unit_system
         except Exception as e:
             return f"Error retrieving unit system: {str(e)}"
@@ -58,7 +60,7 @@ def register_tools(app):
             return error
         
         try:
-            profile = garmin_client.get_user_profile()
+            profile = await call_garmin(garmin_client.get_user_profile)
             if not profile:
                 return "No user profile information found."
             return profile
@@ -73,7 +75,7 @@ def register_tools(app):
             return error
         
         try:
-            settings = garmin_client.get_userprofile_settings()
+            settings = await call_garmin(garmin_client.get_userprofile_settings)
             if not settings:
                 return "No user profile settings found."
             return settings
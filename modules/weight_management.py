@@ -4,6 +4,8 @@ Weight management functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -37,7 +39,7 @@ def register_tools(app):
             return error
         
         try:
-            weigh_ins = garmin_client.get_weigh_ins(start_date, end_date)
+            weigh_ins = await call_garmin(garmin_client.get_weigh_ins, start_date, end_date)
             if not weigh_ins:
                 return f"No weight measurements found between {start_date} and {end_date}."
             return weigh_ins
@@ -56,7 +58,7 @@ def register_tools(app):
             return error
         
         try:
-            weigh_ins = garmin_client.get_daily_weigh_ins(date)
+            weigh_ins = await call_garmin(garmin_client.get_daily_weigh_ins, date)
             if not weigh_ins:
                 return f"No weight measurements found for {date}."
             return weigh_ins
@@ -76,7 +78,7 @@ def register_tools(app):
             return error
         
         try:
-            result = garmin_client.delete_weigh_ins(date, delete_all=delete_all)
+            result = await call_garmin(garmin_client.delete_weigh_ins, date, delete_all=delete_all)
             return result
         except Exception as e:
             return f"Error deleting weight measurements: {str(e)}"
@@ -94,7 +96,7 @@ def register_tools(app):
             return error
         
         try:
-            result = garmin_client.add_weigh_in(weight=weight, unitKey=unit_key)
+            result = await call_garmin(garmin_client.add_weigh_in, weight=weight, unitKey=unit_key)
             return result
         except Exception as e:
             return f"Error adding weight measurement: {str(e)}"
@@ -114,6 +116,10 @@ def register_tools(app):
             date_timestamp: Local timestamp in format YYYY-MM-DDThh:mm:ss
             gmt_timestamp: GMT timestamp in format YYYY-MM-DDThh:mm:ss
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
             if date_timestamp is None or gmt_timestamp is None:
                 # Generate timestamps if not provided
@@ -121,7 +127,8 @@ def register_tools(app):
                 date_timestamp = now.strftime('%Y-%m-%dT%H:%M:%S')
                 gmt_timestamp = now.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
                 
-            result = garmin_client.add_weigh_in_with_timestamps(
+            result = await call_garmin(
+                garmin_client.add_weigh_in_with_timestamps,
                 weight=weight,
                 unitKey=unit_key,
                 dateTimestamp=date_timestamp,
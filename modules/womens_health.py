@@ -4,6 +4,8 @@ Women's health functions for Garmin Connect MCP Server
 import datetime
 from typing import Any, Dict, List, Optional, Union
 
+from modules import NO_CLIENT, call_garmin
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
@@ -15,8 +17,8 @@ def configure(client):
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
@@ -32,7 +34,7 @@ def register_tools(app):
             return error
         
         try:
-            summary = garmin_client.get_pregnancy_summary()
+            summary = await call_garmin(garmin_client.get_pregnancy_summary)
             if not summary:
                 return "No pregnancy summary data found."
             return summary
@@ -51,7 +53,7 @@ def register_tools(app):
             return error
         
         try:
-            data = garmin_client.get_menstrual_data_for_date(date)
+            data = await call_garmin(garmin_client.get_menstrual_data_for_date, date)
             if not data:
                 return f"No menstrual data found for {date}."
             return data
@@ -71,7 +73,7 @@ def register_tools(app):
             return error
         
         try:
-            data = garmin_client.get_menstrual_calendar_data(start_date, end_date)
+            data = await call_garmin(garmin_client.get_menstrual_calendar_data, start_date, end_date)
             if not data:
                 return f"No menstrual calendar data found between {start_date} and {end_date}."
             return data
@@ -2,26 +2,136 @@
 Workout-related functions for Garmin Connect MCP Server
 """
 import datetime
-from typing import Any, Dict, List, Optional, Union, Literal
+import functools
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Final, List, Optional, Union, Literal
 from typing_extensions import TypedDict
 
+from cachetools import TTLCache
+
+from modules import NO_CLIENT, call_garmin
+
+# Prefer orjson for encoding request bodies, falling back to ujson and then the
+# standard library where its wheel can't be installed
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj) -> bytes:
+            return ujson.dumps(obj).encode()
+    except ImportError:
+        import json
+
+        def _dumps(obj) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode()
+
 # The garmin_client will be set by the main file
 garmin_client = None
 
+# Workout upload URL, derived from the client in configure()
+_WORKOUT_URL = None
+
+# Responses for the workout lookup tools
+_NO_WORKOUTS: Final = "No workouts found."
+_NO_WORKOUT: Final = "No workout found with ID {}.".format
+_ERR_GET_WORKOUTS: Final = "Error retrieving workouts: {}".format
+_ERR_GET_WORKOUT: Final = "Error retrieving workout: {}".format
+
+# Short-lived cache of workout lookups, keyed on (tool name, args)
+_cache = TTLCache(maxsize=256, ttl=60)
+
+# Downloaded FIT files, one per workout ID. Files are reused until they are an
+# hour old, and the oldest are evicted once there are more than 64
+_FIT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "garmin_mcp_workouts")
+_FIT_CACHE_TTL = 60 * 60
+_FIT_CACHE_MAX_FILES = 64
+
 
 def configure(client):
     """Configure the module with the Garmin client instance"""
-    global garmin_client
+    global garmin_client, _WORKOUT_URL
     garmin_client = client
+    _WORKOUT_URL = f"{client.garmin_workouts}/workout" if client is not None else None
 
 def _check_client():
     """Check if Garmin client is available"""
-    if not garmin_client:
-        return "❌ Garmin API not available: Missing GARMIN_EMAIL and/or GARMIN_PASSWORD environment variables"
+    if garmin_client is None:
+        return NO_CLIENT
     return None
 
 
 
+def _prune_fit_cache(keep: int = _FIT_CACHE_MAX_FILES) -> None:
+    """Remove expired FIT files from the cache directory and the oldest ones beyond `keep`"""
+    try:
+        entries = list(os.scandir(_FIT_CACHE_DIR))
+    except FileNotFoundError:
+        return
+    
+    files = []
+    for entry in entries:
+        if entry.name.endswith(".fit"):
+            try:
+                files.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass
+    files.sort(reverse=True)
+    
+    cutoff = time.time() - _FIT_CACHE_TTL
+    for index, (mtime, path) in enumerate(files):
+        if index >= keep or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+def _stream_workout_to_file(workout_id: int) -> str:
+    """Stream a workout's FIT file from Garmin Connect into the FIT cache directory
+    
+    A file downloaded within the last _FIT_CACHE_TTL seconds is reused as is.
+    
+    Args:
+        workout_id: ID of the workout to download
+    
+    Returns:
+        Path of the FIT file
+    """
+    path = os.path.join(_FIT_CACHE_DIR, f"workout_{workout_id}.fit")
+    try:
+        if time.time() - os.path.getmtime(path) < _FIT_CACHE_TTL:
+            return path
+    except FileNotFoundError:
+        pass
+    
+    os.makedirs(_FIT_CACHE_DIR, exist_ok=True)
+    url = f"{_WORKOUT_URL}/FIT/{workout_id}"
+    with garmin_client.garth.get("connectapi", url, api=True, stream=True) as response:
+        # Write under a temporary name and move it into place once complete,
+        # so a partial download never sits at the cached path
+        with tempfile.NamedTemporaryFile(
+            dir=_FIT_CACHE_DIR, prefix=f"workout_{workout_id}_", suffix=".part", delete=False
+        ) as part_file:
+            try:
+                for chunk in response.iter_content(chunk_size=65536):
+                    part_file.write(chunk)
+            except Exception:
+                part_file.close()
+                os.unlink(part_file.name)
+                raise
+    os.replace(part_file.name, path)
+    _prune_fit_cache()
+    return path
+
+
+@functools.lru_cache(maxsize=256)
 def _pace_min_km_to_ms(pace_str: str) -> float:
     """Convert pace from min:sec/km format to m/s
     
@@ -32,9 +142,9 @@ def _pace_min_km_to_ms(pace_str: str) -> float:
         Speed in meters per second
     """
     try:
-        if ':' in pace_str:
-            minutes, seconds = pace_str.split(':')
-            total_seconds = int(minutes) * 60 + int(seconds)
+        idx = pace_str.find(':')
+        if idx != -1:
+            total_seconds = int(pace_str[:idx]) * 60 + int(pace_str[idx + 1:])
         else:
             # If no colon, assume it's just minutes
             total_seconds = float(pace_str) * 60
@@ -66,107 +176,263 @@ class RepeatStep(TypedDict):
 WorkoutStep = Union[WorkoutStepBase, RepeatStep]
 
 
+# Steps used by create_workout when none are given. Built once at import;
+# create_workout only reads from it.
+_DEFAULT_WORKOUT_STEPS = (
+    {"type": "warmup", "goal_type": "time", "goal_value": 300, "description": "Warm up"},
+    {"type": "interval", "goal_type": "time", "goal_value": 1200, "target_type": "no.target", "description": "Main set"},
+    {"type": "cooldown", "goal_type": "time", "goal_value": 300, "description": "Cool down"},
+)
+
+
+# Step type mapping
+_STEP_TYPE_MAP = {
+    "warmup": {"stepTypeId": 1, "stepTypeKey": "warmup", "displayOrder": 1},
+    "cooldown": {"stepTypeId": 2, "stepTypeKey": "cooldown", "displayOrder": 2},
+    "interval": {"stepTypeId": 3, "stepTypeKey": "interval", "displayOrder": 3},
+    "rest": {"stepTypeId": 5, "stepTypeKey": "rest", "displayOrder": 5}
+}
+
+# Goal/End condition mapping
+_GOAL_TYPE_MAP = {
+    "time": {"conditionTypeId": 2, "conditionTypeKey": "time", "displayOrder": 2, "displayable": True},
+    "distance": {"conditionTypeId": 3, "conditionTypeKey": "distance", "displayOrder": 3, "displayable": True},
+    "lap_button": {"conditionTypeId": 1, "conditionTypeKey": "lap.button", "displayOrder": 1, "displayable": True}
+}
+
+# Target type mapping
+_TARGET_TYPE_MAP = {
+    "no.target": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
+    "heart_rate": {"workoutTargetTypeId": 4, "workoutTargetTypeKey": "heart.rate.zone", "displayOrder": 4},
+    "pace": {"workoutTargetTypeId": 6, "workoutTargetTypeKey": "pace.zone", "displayOrder": 6}
+}
+
+# Sport type mapping (expand as needed)
+_SPORT_TYPE_MAP = {
+    "running": {"sportTypeId": 1, "sportTypeKey": "running", "displayOrder": 1},
+    "cycling": {"sportTypeId": 2, "sportTypeKey": "cycling", "displayOrder": 2},
+    "swimming": {"sportTypeId": 5, "sportTypeKey": "swimming", "displayOrder": 5},
+    "walking": {"sportTypeId": 9, "sportTypeKey": "walking", "displayOrder": 9}
+}
+
+# Sport types pre-encoded as JSON, spliced directly into request bodies
+_SPORT_TYPE_JSON = {key: _dumps(value) for key, value in _SPORT_TYPE_MAP.items()}
+
+
+# "Not set" stroke and equipment values. Every step refers to these same
+# objects, so nothing may mutate them.
+_NO_STROKE_TYPE = {"strokeTypeId": 0, "strokeTypeKey": None, "displayOrder": 0}
+_NO_EQUIPMENT_TYPE = {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0}
+
+# Fields shared by every executable step; _create_workout_step copies this and
+# fills in the fields that vary
+_STEP_TEMPLATE = {
+    "type": "ExecutableStepDTO",
+    "stepId": None,  # Will be set by Garmin
+    "stepOrder": None,  # Will be set when building workout
+    "stepType": None,
+    "childStepId": None,
+    "description": None,
+    "endCondition": None,
+    "endConditionValue": None,
+    "preferredEndConditionUnit": None,
+    "endConditionCompare": None,
+    "targetType": None,
+    "targetValueOne": None,
+    "targetValueTwo": None,
+    "targetValueUnit": None,
+    "zoneNumber": None,
+    "secondaryTargetType": None,
+    "secondaryTargetValueOne": None,
+    "secondaryTargetValueTwo": None,
+    "secondaryTargetValueUnit": None,
+    "secondaryZoneNumber": None,
+    "endConditionZone": None,
+    "strokeType": _NO_STROKE_TYPE,
+    "equipmentType": _NO_EQUIPMENT_TYPE,
+    "category": None,
+    "exerciseName": None,
+    "workoutProvider": None,
+    "providerExerciseSourceId": None,
+    "weightValue": None,
+    "weightUnit": None
+}
+
+# Fields shared by every repeat group; _create_repeat_group copies this and
+# fills in the steps and iteration count
+_REPEAT_GROUP_TEMPLATE = {
+    "type": "RepeatGroupDTO",
+    "stepId": None,  # Will be set by Garmin
+    "stepOrder": None,  # Will be set when building workout
+    "stepType": {"stepTypeId": 6, "stepTypeKey": "repeat", "displayOrder": 6},
+    "childStepId": 1,
+    "numberOfIterations": None,
+    "workoutSteps": None,
+    "endConditionValue": None,
+    "preferredEndConditionUnit": None,
+    "endConditionCompare": None,
+    "endCondition": {"conditionTypeId": 7, "conditionTypeKey": "iterations", "displayOrder": 7, "displayable": False},
+    "skipLastRestStep": False,
+    "smartRepeat": False
+}
+
+
+def _collect_pace_targets(steps) -> set:
+    """Collect the distinct "M:SS" pace targets used by a list of workout steps, including repeat groups"""
+    paces = set()
+    for step_data in steps:
+        if step_data["type"] == "repeat":
+            paces |= _collect_pace_targets(step_data["repeat_steps"])
+        elif step_data.get("target_type") == "pace":
+            for target in (step_data.get("target_min"), step_data.get("target_max")):
+                if target and isinstance(target, str):
+                    paces.add(target)
+    return paces
+
+
 def _create_workout_step(step_type: str, goal_type: str, goal_value: Union[int, float], 
                         target_type: str = "no.target", target_min: Optional[Union[int, float]] = None,
                         target_max: Optional[Union[int, float]] = None, description: str = None) -> Dict:
     """Create a workout step with the specified parameters"""
+    step = _STEP_TEMPLATE.copy()
+    step["stepType"] = _STEP_TYPE_MAP[step_type]
+    step["description"] = description
+    step["endCondition"] = _GOAL_TYPE_MAP[goal_type]
+    step["endConditionValue"] = goal_value
+    step["targetType"] = _TARGET_TYPE_MAP[target_type]
+    step["targetValueOne"] = target_min
+    step["targetValueTwo"] = target_max
+    
+    return step
+
+
+@dataclass(slots=True)
+class _ExecutableStep:
+    """Compact form of a workout step while create_workout assembles the workout"""
+    step_type: str
+    goal_type: str
+    goal_value: Union[int, float]
+    target_type: str
+    target_min: Optional[Union[int, float]]
+    target_max: Optional[Union[int, float]]
+    description: Optional[str]
+    step_order: int
+    child_step_id: Optional[int] = None
     
-    # Step type mapping
-    step_type_map = {
-        "warmup": {"stepTypeId": 1, "stepTypeKey": "warmup", "displayOrder": 1},
-        "cooldown": {"stepTypeId": 2, "stepTypeKey": "cooldown", "displayOrder": 2},
-        "interval": {"stepTypeId": 3, "stepTypeKey": "interval", "displayOrder": 3},
-        "rest": {"stepTypeId": 5, "stepTypeKey": "rest", "displayOrder": 5}
-    }
+    def to_dict(self) -> Dict:
+        """Convert to the Garmin Connect ExecutableStepDTO shape"""
+        step = _create_workout_step(
+            step_type=self.step_type,
+            goal_type=self.goal_type,
+            goal_value=self.goal_value,
+            target_type=self.target_type,
+            target_min=self.target_min,
+            target_max=self.target_max,
+            description=self.description
+        )
+        step["stepOrder"] = self.step_order
+        if self.child_step_id is not None:
+            step["childStepId"] = self.child_step_id
+        return step
+
+
+@dataclass(slots=True)
+class _RepeatGroup:
+    """Compact form of a repeat group while create_workout assembles the workout"""
+    iterations: int
+    steps: List[_ExecutableStep]
+    step_order: int
     
-    # Goal/End condition mapping
-    goal_type_map = {
-        "time": {"conditionTypeId": 2, "conditionTypeKey": "time", "displayOrder": 2, "displayable": True},
-        "distance": {"conditionTypeId": 3, "conditionTypeKey": "distance", "displayOrder": 3, "displayable": True},
-        "lap_button": {"conditionTypeId": 1, "conditionTypeKey": "lap.button", "displayOrder": 1, "displayable": True}
-    }
+    def to_dict(self) -> Dict:
+        """Convert to the Garmin Connect RepeatGroupDTO shape"""
+        group = _create_repeat_group([step.to_dict() for step in self.steps], self.iterations)
+        group["stepOrder"] = self.step_order
+        return group
+
+
+def _build_regular_step(step_data: Dict, step_order: int, pace_ms: Dict[str, float]) -> _ExecutableStep:
+    """Build a non-repeat workout step from its tool-argument form
     
-    # Target type mapping
-    target_type_map = {
-        "no.target": {"workoutTargetTypeId": 1, "workoutTargetTypeKey": "no.target", "displayOrder": 1},
-        "heart_rate": {"workoutTargetTypeId": 4, "workoutTargetTypeKey": "heart.rate.zone", "displayOrder": 4},
-        "pace": {"workoutTargetTypeId": 6, "workoutTargetTypeKey": "pace.zone", "displayOrder": 6}
-    }
+    Args:
+        step_data: Step as passed to create_workout (type, goal_type, goal_value, targets, description)
+        step_order: Position of the step within its parent
+        pace_ms: Pace strings already converted to m/s by _pace_min_km_to_ms
+    """
+    target_type = step_data.get("target_type", "no.target")
+    target_min = step_data.get("target_min")
+    target_max = step_data.get("target_max")
     
-    step = {
-        "type": "ExecutableStepDTO",
-        "stepId": None,  # Will be set by Garmin
-        "stepOrder": None,  # Will be set when building workout
-        "stepType": step_type_map[step_type],
-        "childStepId": None,
-        "description": description,
-        "endCondition": goal_type_map[goal_type],
-        "endConditionValue": goal_value,
-        "preferredEndConditionUnit": None,
-        "endConditionCompare": None,
-        "targetType": target_type_map[target_type],
-        "targetValueOne": target_min,
-        "targetValueTwo": target_max,
-        "targetValueUnit": None,
-        "zoneNumber": None,
-        "secondaryTargetType": None,
-        "secondaryTargetValueOne": None,
-        "secondaryTargetValueTwo": None,
-        "secondaryTargetValueUnit": None,
-        "secondaryZoneNumber": None,
-        "endConditionZone": None,
-        "strokeType": {"strokeTypeId": 0, "strokeTypeKey": None, "displayOrder": 0},
-        "equipmentType": {"equipmentTypeId": 0, "equipmentTypeKey": None, "displayOrder": 0},
-        "category": None,
-        "exerciseName": None,
-        "workoutProvider": None,
-        "providerExerciseSourceId": None,
-        "weightValue": None,
-        "weightUnit": None
-    }
+    # Convert pace if needed
+    if target_type == "pace":
+        if target_min and isinstance(target_min, str):
+            target_min = pace_ms[target_min]
+        if target_max and isinstance(target_max, str):
+            target_max = pace_ms[target_max]
     
-    return step
+    return _ExecutableStep(
+        step_type=step_data["type"],
+        goal_type=step_data["goal_type"],
+        goal_value=step_data["goal_value"],
+        target_type=target_type,
+        target_min=target_min,
+        target_max=target_max,
+        description=step_data.get("description"),
+        step_order=step_order
+    )
 
 
 def _create_repeat_group(steps: List[Dict], iterations: int) -> Dict:
     """Create a repeat group containing multiple steps"""
-    return {
-        "type": "RepeatGroupDTO",
-        "stepId": None,  # Will be set by Garmin
-        "stepOrder": None,  # Will be set when building workout
-        "stepType": {"stepTypeId": 6, "stepTypeKey": "repeat", "displayOrder": 6},
-        "childStepId": 1,
-        "numberOfIterations": iterations,
-        "workoutSteps": steps,
-        "endConditionValue": iterations,
-        "preferredEndConditionUnit": None,
-        "endConditionCompare": None,
-        "endCondition": {"conditionTypeId": 7, "conditionTypeKey": "iterations", "displayOrder": 7, "displayable": False},
-        "skipLastRestStep": False,
-        "smartRepeat": False
-    }
+    group = _REPEAT_GROUP_TEMPLATE.copy()
+    group["numberOfIterations"] = iterations
+    group["workoutSteps"] = steps
+    group["endConditionValue"] = iterations
+    return group
+
+
+def _build_workout_body(workout_name: str, description: Optional[str], sport_type_json: bytes,
+                        workout_steps: List[Union[_ExecutableStep, _RepeatGroup]]) -> bytes:
+    """Serialize a workout straight to the JSON request body expected by Garmin Connect
+    
+    Each step is encoded on its own and spliced into the envelope, so the full
+    nested workout dict is never built just to be serialized.
+    """
+    return b"".join((
+        b'{"workoutName":', _dumps(workout_name),
+        b',"description":', _dumps(description),
+        b',"sportType":', sport_type_json,
+        b',"workoutSegments":[{"segmentOrder":1,"sportType":', sport_type_json,
+        b',"workoutSteps":[', b",".join(_dumps(step.to_dict()) for step in workout_steps),
+        b']}]}',
+    ))
 
 
 def register_tools(app):
     """Register all workout-related tools with the MCP server app"""
     
     @app.tool()
-    async def get_workouts() -> str:
+    async def get_workouts() -> Union[List[Dict], str]:
         """Get all workouts"""
         error = _check_client()
         if error:
             return error
         
+        key = ("get_workouts",)
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            workouts = garmin_client.get_workouts()
+            workouts = await call_garmin(garmin_client.get_workouts)
             if not workouts:
-                return "No workouts found."
+                return _NO_WORKOUTS
+            _cache[key] = workouts
             return workouts
         except Exception as e:
-            return f"Error retrieving workouts: {str(e)}"
+            return _ERR_GET_WORKOUTS(e)
     
     @app.tool()
-    async def get_workout_by_id(workout_id: int) -> str:
+    async def get_workout_by_id(workout_id: int) -> Union[Dict, str]:
         """Get details for a specific workout
         
         Args:
@@ -176,13 +442,26 @@ def register_tools(app):
         if error:
             return error
         
+        key = ("get_workout_by_id", workout_id)
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            workout = garmin_client.get_workout_by_id(workout_id)
+            workout = await call_garmin(garmin_client.get_workout_by_id, workout_id)
             if not workout:
-                return f"No workout found with ID {workout_id}."
+                return _NO_WORKOUT(workout_id)
+            _cache[key] = workout
             return workout
         except Exception as e:
-            return f"Error retrieving workout: {str(e)}"
+            return _ERR_GET_WORKOUT(e)
+    
+    @app.tool()
+    async def clear_workout_cache() -> str:
+        """Clear cached workout data and FIT files so the next lookup fetches fresh data from Garmin Connect"""
+        _cache.clear()
+        _prune_fit_cache(keep=0)
+        return "Workout cache cleared."
     
     @app.tool()
     async def download_workout(workout_id: str) -> str:
@@ -196,7 +475,7 @@ def register_tools(app):
             return error
         
         try:
-            workout_data = garmin_client.download_workout(workout_id)
+            workout_data = await call_garmin(garmin_client.download_workout, workout_id)
             if not workout_data:
                 return f"No workout data found for workout with ID {workout_id}."
             
@@ -205,6 +484,23 @@ def register_tools(app):
         except Exception as e:
             return f"Error downloading workout: {str(e)}"
     
+    @app.tool()
+    async def download_workout_to_cache(workout_id: int) -> str:
+        """Download a workout as a FIT file into the server's FIT cache directory and return the file path
+        
+        Args:
+            workout_id: ID of the workout to download
+        """
+        error = _check_client()
+        if error:
+            return error
+        
+        try:
+            path = await call_garmin(_stream_workout_to_file, workout_id)
+            return f"Workout data for ID {workout_id} saved as a FIT file at {path}."
+        except Exception as e:
+            return f"Error downloading workout: {str(e)}"
+    
     @app.tool()
     async def create_workout(
         workout_name: str,
@@ -250,106 +546,53 @@ def register_tools(app):
             {"type": "cooldown", "goal_type": "time", "goal_value": 300, "description": "Cool down"}
         ]
         """
+        error = _check_client()
+        if error:
+            return error
+        
         try:
             # Use default workout if no steps provided
             if steps is None:
-                steps = [
-                    {"type": "warmup", "goal_type": "time", "goal_value": 300, "description": "Warm up"},
-                    {"type": "interval", "goal_type": "time", "goal_value": 1200, "target_type": "no.target", "description": "Main set"},
-                    {"type": "cooldown", "goal_type": "time", "goal_value": 300, "description": "Cool down"}
-                ]
+                steps = _DEFAULT_WORKOUT_STEPS
+            
+            # Convert every distinct pace target once, up front
+            pace_ms = {pace: _pace_min_km_to_ms(pace) for pace in _collect_pace_targets(steps)}
             
-            # Build workout steps
-            workout_steps = []
-            step_order = 1
+            # Build workout steps (sizes are known up front, so preallocate)
+            workout_steps = [None] * len(steps)
             
-            for step_data in steps:
+            for i, step_data in enumerate(steps):
+                step_order = i + 1
                 if step_data["type"] == "repeat":
                     # Handle repeat groups
-                    repeat_steps = []
-                    child_step_order = 1
+                    repeat_steps_data = step_data["repeat_steps"]
+                    repeat_steps = [None] * len(repeat_steps_data)
                     
-                    for repeat_step_data in step_data["repeat_steps"]:
-                        # Convert pace if needed
-                        target_min = repeat_step_data.get("target_min")
-                        target_max = repeat_step_data.get("target_max")
-                        
-                        if repeat_step_data.get("target_type") == "pace":
-                            if target_min and isinstance(target_min, str):
-                                target_min = _pace_min_km_to_ms(target_min)
-                            if target_max and isinstance(target_max, str):
-                                target_max = _pace_min_km_to_ms(target_max)
-                        
-                        repeat_step = _create_workout_step(
-                            step_type=repeat_step_data["type"],
-                            goal_type=repeat_step_data["goal_type"], 
-                            goal_value=repeat_step_data["goal_value"],
-                            target_type=repeat_step_data.get("target_type", "no.target"),
-                            target_min=target_min,
-                            target_max=target_max,
-                            description=repeat_step_data.get("description")
-                        )
-                        repeat_step["stepOrder"] = child_step_order
-                        repeat_step["childStepId"] = 1
-                        repeat_steps.append(repeat_step)
-                        child_step_order += 1
+                    for j, repeat_step_data in enumerate(repeat_steps_data):
+                        repeat_step = _build_regular_step(repeat_step_data, j + 1, pace_ms)
+                        repeat_step.child_step_id = 1
+                        repeat_steps[j] = repeat_step
                     
-                    repeat_group = _create_repeat_group(repeat_steps, step_data["iterations"])
-                    repeat_group["stepOrder"] = step_order
-                    workout_steps.append(repeat_group)
+                    workout_steps[i] = _RepeatGroup(step_data["iterations"], repeat_steps, step_order)
                 else:
                     # Handle regular steps
-                    target_min = step_data.get("target_min")
-                    target_max = step_data.get("target_max")
-                    
-                    # Convert pace if needed
-                    if step_data.get("target_type") == "pace":
-                        if target_min and isinstance(target_min, str):
-                            target_min = _pace_min_km_to_ms(target_min)
-                        if target_max and isinstance(target_max, str):
-                            target_max = _pace_min_km_to_ms(target_max)
-                    
-                    step = _create_workout_step(
-                        step_type=step_data["type"],
-                        goal_type=step_data["goal_type"],
-                        goal_value=step_data["goal_value"],
-                        target_type=step_data.get("target_type", "no.target"),
-                        target_min=target_min,
-                        target_max=target_max,
-                        description=step_data.get("description")
-                    )
-                    step["stepOrder"] = step_order
-                    workout_steps.append(step)
-                
-                step_order += 1
+                    workout_steps[i] = _build_regular_step(step_data, step_order, pace_ms)
             
-            # Sport type mapping (expand as needed)
-            sport_type_map = {
-                "running": {"sportTypeId": 1, "sportTypeKey": "running", "displayOrder": 1},
-                "cycling": {"sportTypeId": 2, "sportTypeKey": "cycling", "displayOrder": 2},
-                "swimming": {"sportTypeId": 5, "sportTypeKey": "swimming", "displayOrder": 5},
-                "walking": {"sportTypeId": 9, "sportTypeKey": "walking", "displayOrder": 9}
-            }
-            
-            sport_type_data = sport_type_map.get(sport_type, sport_type_map["running"])
+            sport_type_json = _SPORT_TYPE_JSON.get(sport_type, _SPORT_TYPE_JSON["running"])
             
             # Build the complete workout
-            workout_data = {
-                "workoutName": workout_name,
-                "description": description,
-                "sportType": sport_type_data,
-                "workoutSegments": [
-                    {
-                        "segmentOrder": 1,
-                        "sportType": sport_type_data,
-                        "workoutSteps": workout_steps
-                    }
-                ]
-            }
+            body = _build_workout_body(workout_name, description, sport_type_json, workout_steps)
             
             # Upload the workout
-            url = f"{garmin_client.garmin_workouts}/workout"
-            result = garmin_client.garth.post("connectapi", url, json=workout_data, api=True)
+            result = await call_garmin(
+                garmin_client.garth.post,
+                "connectapi",
+                _WORKOUT_URL,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                api=True,
+            )
+            _cache.clear()
             
             return f"Workout '{workout_name}' created successfully! Result: {result}"
             